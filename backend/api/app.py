@@ -4,8 +4,12 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import logging
 
+from core.cache import close_redis
 from core.config import get_settings
 from core.database import init_db
+from core.http import close_http_client
+from .balances import balance_refresher
+from .responses import FastJSONResponse
 from .routes import blocks_router, transactions_router, accounts_router, stats_router
 
 settings = get_settings()
@@ -25,11 +29,15 @@ async def lifespan(app: FastAPI):
     logging.info("Initializing database...")
     await init_db()
     logging.info("Database initialized")
+    await balance_refresher.start()
 
     yield
 
     # Shutdown
     logging.info("Shutting down...")
+    await balance_refresher.stop()
+    await close_http_client()
+    await close_redis()
 
 
 app = FastAPI(
@@ -37,15 +45,18 @@ app = FastAPI(
     description="API for ComputeChain blockchain explorer",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins,
+    allow_origin_regex=settings.cors_origin_regex,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=settings.cors_max_age,
 )
 
 # Include routers
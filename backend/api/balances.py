@@ -0,0 +1,249 @@
+"""Node balance lookups and background balance refresh."""
+from contextlib import suppress
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+import asyncio
+import json
+import logging
+from redis.exceptions import RedisError
+from sqlalchemy import BigInteger, Numeric, String, cast, column, func, or_, update, values
+
+from core.cache import VALIDATORS_KEY, get_redis, invalidate
+from core.config import get_settings
+from core.database import get_session_context
+from core.http import ServiceOverloadError, node_request, refresh_limiter
+from core.utils import utcnow
+from models import Account
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Hot settings bound once; Settings is frozen so these cannot go stale
+_NODE_URL = settings.node_url
+_BALANCE_CACHE_TTL = settings.balance_cache_ttl
+
+# Rows per UPDATE statement, keeping bind parameters well under the asyncpg limit
+REFRESH_CHUNK_SIZE = 5000
+
+
+async def fetch_balance_from_node(address: str) -> Optional[dict]:
+    """Fetch account balance from blockchain node."""
+    try:
+        resp = await node_request("GET", f"{_NODE_URL}/balance/{address}")
+        if resp.status_code == 200:
+            return resp.json()
+    except Exception:
+        pass
+    return None
+
+
+def balance_key(address: str) -> str:
+    """Redis key for a cached node balance."""
+    return f"bal:{address}"
+
+
+async def get_cached_balances(addresses: list[str]) -> dict[str, dict]:
+    """Return node balances still in the Redis cache, keyed by address."""
+    if not addresses:
+        return {}
+
+    try:
+        cached = await get_redis().mget([balance_key(address) for address in addresses])
+    except RedisError:
+        return {}
+
+    return {
+        address: json.loads(value)
+        for address, value in zip(addresses, cached)
+        if value is not None
+    }
+
+
+async def fetch_balances_batch(addresses: list[str]) -> dict[str, dict]:
+    """Fetch balances for multiple addresses, serving recent lookups from Redis."""
+    if not addresses:
+        return {}
+
+    redis = get_redis()
+    results = await get_cached_balances(addresses)
+    misses = [address for address in addresses if address not in results]
+
+    if not misses:
+        return results
+
+    # Only hit the node for addresses not cached
+    try:
+        fresh = None
+        if settings.node_batch_balances:
+            fresh = await _fetch_balances_bulk(misses)
+        if fresh is None:
+            fresh = await _fetch_balances_each(misses)
+    except ServiceOverloadError as e:
+        logger.warning(f"Node overloaded, serving cached balances only: {e}")
+        return results
+
+    if fresh:
+        try:
+            async with redis.pipeline(transaction=False) as pipe:
+                for address, data in fresh.items():
+                    pipe.setex(balance_key(address), _BALANCE_CACHE_TTL, json.dumps(data))
+                await pipe.execute()
+        except RedisError:
+            pass
+        results.update(fresh)
+
+    return results
+
+
+async def _fetch_balances_bulk(addresses: list[str]) -> Optional[dict[str, dict]]:
+    """Fetch balances with one POST to the node; None if the call fails.
+
+    Overload propagates, since falling back to per-address GETs would
+    only add load.
+    """
+    try:
+        resp = await node_request(
+            "POST", f"{_NODE_URL}/balances", json={"addresses": addresses},
+            limiter=refresh_limiter,
+        )
+        if resp.status_code != 200:
+            return None
+        data = resp.json()
+    except ServiceOverloadError:
+        raise
+    except Exception:
+        return None
+
+    if not isinstance(data, dict):
+        return None
+    return {
+        address: data[address]
+        for address in addresses
+        if isinstance(data.get(address), dict)
+    }
+
+
+async def _fetch_balances_each(addresses: list[str]) -> dict[str, dict]:
+    """Fetch balances with one GET per address, bounded by the refresh limiter."""
+    tasks = [
+        node_request("GET", f"{_NODE_URL}/balance/{address}", limiter=refresh_limiter)
+        for address in addresses
+    ]
+    responses = await asyncio.gather(*tasks, return_exceptions=True)
+
+    results: dict[str, dict] = {}
+    for address, response in zip(addresses, responses):
+        if isinstance(response, Exception):
+            continue
+        if response.status_code != 200:
+            continue
+        data = response.json()
+        if isinstance(data, dict):
+            results[address] = data
+
+    return results
+
+
+class BalanceRefresher:
+    """Refreshes account balances from the node off the request path.
+
+    List endpoints enqueue the addresses they served; a single worker
+    coalesces them for a short window, queries the node once and writes
+    all fresh balances back in one UPDATE.
+    """
+
+    def __init__(self):
+        self.queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """Start the refresh worker."""
+        self.queue = asyncio.Queue(maxsize=settings.balance_refresh_queue_size)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the refresh worker."""
+        if self._task:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    def enqueue(self, addresses: list[str]):
+        """Schedule addresses for refresh; dropped if the queue is full."""
+        if self.queue is None or not addresses:
+            return
+        try:
+            self.queue.put_nowait(addresses)
+        except asyncio.QueueFull:
+            pass
+
+    async def _run(self):
+        """Worker loop."""
+        while True:
+            addresses = set(await self.queue.get())
+
+            # Coalesce requests arriving within the window
+            await asyncio.sleep(settings.balance_refresh_delay)
+            while not self.queue.empty():
+                addresses.update(self.queue.get_nowait())
+
+            try:
+                await self._refresh(list(addresses))
+            except Exception as e:
+                logger.error(f"Balance refresh failed: {e}")
+
+    async def _refresh(self, addresses: list[str]):
+        """Fetch balances from the node and bulk-update accounts."""
+        node_data = await fetch_balances_batch(addresses)
+        if not node_data:
+            return
+
+        rows = [
+            (address, Decimal(str(data.get("balance", 0))), data.get("nonce"))
+            for address, data in node_data.items()
+        ]
+        now = utcnow()
+        validators_changed = False
+
+        async with get_session_context() as session:
+            for i in range(0, len(rows), REFRESH_CHUNK_SIZE):
+                result = await session.execute(_balance_update(rows[i:i + REFRESH_CHUNK_SIZE], now))
+                validators_changed |= any(result.scalars().all())
+
+        # The cached validator list carries DB balances; drop it so it never
+        # falls behind what the database already holds
+        if validators_changed:
+            await invalidate(VALIDATORS_KEY)
+
+
+def _balance_update(rows: list[tuple], now: datetime):
+    """Build one UPDATE ... FROM (VALUES ...) for (address, balance, nonce) rows.
+
+    Rows whose balance and nonce are unchanged are skipped so a refresh of
+    an idle page writes nothing. Returns is_validator for each updated row.
+    """
+    fresh = values(
+        column("address", String),
+        column("balance", Numeric),
+        column("nonce", BigInteger),
+        name="fresh",
+    ).data(rows)
+    # VALUES renders a missing nonce as a bare NULL; if a whole chunk lacks it,
+    # Postgres infers the column as text, so pin its type explicitly
+    nonce = func.coalesce(cast(fresh.c.nonce, BigInteger), Account.nonce)
+    return (
+        update(Account)
+        .where(Account.address == fresh.c.address)
+        .where(or_(
+            Account.balance.is_distinct_from(fresh.c.balance),
+            Account.nonce.is_distinct_from(nonce),
+        ))
+        .values(balance=fresh.c.balance, nonce=nonce, updated_at=now)
+        .returning(Account.is_validator)
+        .execution_options(synchronize_session=False)
+    )
+
+
+balance_refresher = BalanceRefresher()
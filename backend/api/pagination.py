@@ -0,0 +1,122 @@
+"""Pagination helpers shared by list endpoints."""
+import base64
+from fastapi import HTTPException
+from typing import Optional
+from decimal import Decimal
+from sqlalchemy import BigInteger, Integer, Numeric, Select, SmallInteger, func, literal, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import Counter
+
+
+def encode_cursor(*values) -> str:
+    """Encode a keyset position as an opaque cursor."""
+    return base64.urlsafe_b64encode(":".join(str(v) for v in values).encode()).decode()
+
+
+def decode_cursor(cursor: str, *types) -> tuple:
+    """Decode a cursor into a keyset position, converting each part with `types`."""
+    try:
+        parts = base64.urlsafe_b64decode(cursor.encode()).decode().split(":")
+        if len(parts) != len(types):
+            raise ValueError(cursor)
+        return tuple(t(part) for t, part in zip(types, parts))
+    except (ValueError, ArithmeticError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _fits(value, column_type) -> bool:
+    """Whether a decoded cursor part can be bound as `column_type` without driver errors."""
+    if isinstance(value, Decimal):
+        if not value.is_finite():
+            return False
+        if isinstance(column_type, Numeric) and column_type.precision is not None:
+            return abs(value) < Decimal(10) ** (column_type.precision - (column_type.scale or 0))
+        return True
+    if isinstance(value, int):
+        # Subclasses of Integer first
+        for int_type, bits in ((SmallInteger, 16), (BigInteger, 64), (Integer, 32)):
+            if isinstance(column_type, int_type):
+                return -(1 << (bits - 1)) <= value < 1 << (bits - 1)
+    return True
+
+
+def after_cursor(query: Select, cursor: str, columns: tuple, types: tuple, descending: bool = True) -> Select:
+    """Restrict `query`, ordered by `columns`, to rows past the cursor position."""
+    values = decode_cursor(cursor, *types)
+    if not all(_fits(value, column.type) for value, column in zip(values, columns)):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    key = tuple_(*columns)
+    # Bind each part with its key column's type, not as a generic INTEGER
+    position = tuple_(*(literal(value, column.type) for value, column in zip(values, columns)))
+    return query.where(key < position if descending else key > position)
+
+
+def page_info(page: int, limit: int, total: int) -> dict:
+    """Offset pagination block for a list response."""
+    return {
+        "page": page,
+        "limit": limit,
+        "total": total,
+        "pages": (total + limit - 1) // limit if total > 0 else 0,
+    }
+
+
+def next_cursor(rows: list, limit: int, *attrs: str) -> Optional[str]:
+    """Cursor for the page following `rows`, or None on the last page."""
+    if len(rows) < limit:
+        return None
+    return encode_cursor(*(getattr(rows[-1], attr) for attr in attrs))
+
+
+async def fetch_page(
+    session: AsyncSession,
+    query: Select,
+    offset: int,
+    limit: int,
+    counter: Optional[str] = None,
+) -> tuple[list, int]:
+    """Fetch one page of rows together with the total row count.
+
+    The total comes from a COUNT(*) window over the same query, or, for
+    unfiltered queries, from the indexer-maintained `counter`, so a page
+    costs a single round-trip. Past the last page there are no rows to
+    carry it, so read the counter on its own; a plain count is the last
+    resort when no counter is available (e.g. before the indexer seeds it).
+    """
+    if counter:
+        total = select(Counter.value).where(Counter.key == counter).scalar_subquery()
+    else:
+        total = func.count().over()
+
+    result = await session.execute(
+        query
+        .add_columns(total.label("total"))
+        .offset(offset)
+        .limit(limit)
+    )
+    rows = result.all()
+    if rows and rows[0].total is not None:
+        return rows, rows[0].total
+    if not rows and offset == 0:
+        return [], 0
+
+    total = None
+    if counter:
+        counter_result = await session.execute(
+            select(Counter.value).where(Counter.key == counter)
+        )
+        total = counter_result.scalar()
+    if total is None:
+        count_result = await session.execute(
+            select(func.count()).select_from(query.order_by(None).subquery())
+        )
+        total = count_result.scalar()
+    return rows, total
+
+
+async def fetch_after(session: AsyncSession, query: Select, limit: int) -> list:
+    """Fetch one keyset page of rows; the cursor filter is already on `query`."""
+    result = await session.execute(query.limit(limit))
+    return result.all()
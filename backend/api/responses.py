@@ -0,0 +1,19 @@
+"""Response classes."""
+from typing import Any
+from fastapi.responses import JSONResponse
+import orjson
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+
+    orjson rejects integers wider than 64 bits, which can appear in JSONB
+    payloads and validator info; those responses fall back to the stdlib
+    encoder instead of failing.
+    """
+
+    def render(self, content: Any) -> bytes:
+        try:
+            return orjson.dumps(content)
+        except TypeError:
+            return super().render(content)
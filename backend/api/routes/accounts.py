@@ -1,54 +1,29 @@
 """Account API endpoints."""
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select, func, desc, or_
+from sqlalchemy import select, update, func, desc, literal_column, or_, union_all
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 from decimal import Decimal
-from datetime import datetime
 import asyncio
-import httpx
 
-from core.database import get_session
+from core.cache import VALIDATORS_KEY, cached, invalidate
+from core.database import fetch_scalar, get_session
 from core.config import get_settings
-from models import Account, Transaction
+from core.utils import format_big_int, utcnow
+from models import Account, Counter, Transaction, ACCOUNTS_TOTAL
+from ..balances import balance_key, balance_refresher, fetch_balance_from_node, get_cached_balances
+from ..pagination import after_cursor, encode_cursor, fetch_after, fetch_page, next_cursor, page_info
+from .transactions import TX_LIST_COLUMNS
 
 router = APIRouter(prefix="/accounts", tags=["accounts"])
 settings = get_settings()
 
-
-async def fetch_balance_from_node(address: str) -> Optional[dict]:
-    """Fetch account balance from blockchain node."""
-    try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            resp = await client.get(f"{settings.node_url}/balance/{address}")
-            if resp.status_code == 200:
-                return resp.json()
-    except Exception:
-        pass
-    return None
-
-
-async def fetch_balances_batch(addresses: list[str]) -> dict[str, dict]:
-    """Fetch balances for multiple addresses in parallel."""
-    if not addresses:
-        return {}
-
-    results: dict[str, dict] = {}
-    async with httpx.AsyncClient(timeout=5.0) as client:
-        tasks = [client.get(f"{settings.node_url}/balance/{address}") for address in addresses]
-        responses = await asyncio.gather(*tasks, return_exceptions=True)
-
-    for address, response in zip(addresses, responses):
-        if isinstance(response, Exception):
-            continue
-        if response.status_code != 200:
-            continue
-        data = response.json()
-        if isinstance(data, dict):
-            results[address] = data
-
-    return results
+# Columns read by the list responses; avoids hydrating full ORM objects
+_ACCOUNT_LIST_COLUMNS = (
+    Account.id, Account.address, Account.balance, Account.nonce,
+    Account.tx_count, Account.last_seen_height, Account.is_validator,
+)
 
 
 @router.get("")
@@ -57,57 +32,42 @@ async def get_accounts(
     limit: int = Query(settings.default_page_size, ge=1, le=settings.max_page_size),
     sort_by: str = Query("balance", description="Sort by: balance, tx_count, last_seen"),
     order: str = Query("desc", description="Order: asc or desc"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from a previous page's next_cursor"),
     session: AsyncSession = Depends(get_session),
 ):
     """Get paginated list of accounts."""
     offset = (page - 1) * limit
 
-    # Get total count
-    count_result = await session.execute(select(func.count(Account.id)))
-    total = count_result.scalar()
-
-    # Build sort
-    sort_column = {
-        "balance": Account.balance,
-        "tx_count": Account.tx_count,
-        "last_seen": Account.last_seen_height,
-    }.get(sort_by, Account.balance)
-
-    order_func = desc if order == "desc" else lambda x: x
-
-    # Get accounts
-    result = await session.execute(
-        select(Account)
-        .order_by(order_func(sort_column))
-        .offset(offset)
-        .limit(limit)
+    # Build sort (id breaks ties so keyset positions are unique)
+    sort_key, sort_attr, sort_type = {
+        "balance": (Account.balance, "balance", Decimal),
+        "tx_count": (Account.tx_count, "tx_count", int),
+        "last_seen": (func.coalesce(Account.last_seen_height, 0), "last_seen_height", int),
+    }.get(sort_by, (Account.balance, "balance", Decimal))
+
+    descending = order == "desc"
+    order_func = desc if descending else lambda x: x
+    query = select(*_ACCOUNT_LIST_COLUMNS).order_by(order_func(sort_key), order_func(Account.id))
+
+    if cursor:
+        query = after_cursor(query, cursor, (sort_key, Account.id), (sort_type, int), descending)
+        accounts = await fetch_after(session, query, limit)
+        pagination = {"limit": limit}
+    else:
+        # Get accounts with total count
+        accounts, total = await fetch_page(session, query, offset, limit, counter=ACCOUNTS_TOTAL)
+        pagination = page_info(page, limit, total)
+    pagination["next_cursor"] = (
+        encode_cursor(getattr(accounts[-1], sort_attr) or 0, accounts[-1].id)
+        if len(accounts) == limit else None
     )
-    accounts = result.scalars().all()
 
-    # Refresh balances from node for the current page
-    node_data = await fetch_balances_batch([account.address for account in accounts])
-    if node_data:
-        updated = False
-        now = datetime.utcnow()
-        for account in accounts:
-            data = node_data.get(account.address)
-            if not data:
-                continue
-            account.balance = Decimal(str(data.get("balance", 0)))
-            account.nonce = data.get("nonce", account.nonce)
-            account.updated_at = now
-            updated = True
-        if updated:
-            await session.commit()
+    # Refresh balances from node for the current page in the background
+    balance_refresher.enqueue([account.address for account in accounts])
 
     return {
         "accounts": [_account_to_dict(a) for a in accounts],
-        "pagination": {
-            "page": page,
-            "limit": limit,
-            "total": total,
-            "pages": (total + limit - 1) // limit if total > 0 else 0,
-        }
+        "pagination": pagination,
     }
 
 
@@ -118,26 +78,13 @@ async def get_top_accounts(
 ):
     """Get top accounts by balance."""
     result = await session.execute(
-        select(Account)
+        select(*_ACCOUNT_LIST_COLUMNS)
         .order_by(desc(Account.balance))
         .limit(limit)
     )
-    accounts = result.scalars().all()
+    accounts = result.all()
 
-    node_data = await fetch_balances_batch([account.address for account in accounts])
-    if node_data:
-        updated = False
-        now = datetime.utcnow()
-        for account in accounts:
-            data = node_data.get(account.address)
-            if not data:
-                continue
-            account.balance = Decimal(str(data.get("balance", 0)))
-            account.nonce = data.get("nonce", account.nonce)
-            account.updated_at = now
-            updated = True
-        if updated:
-            await session.commit()
+    balance_refresher.enqueue([account.address for account in accounts])
 
     return {"accounts": [_account_to_dict(a) for a in accounts]}
 
@@ -147,29 +94,33 @@ async def get_validators(
     session: AsyncSession = Depends(get_session),
 ):
     """Get all validator accounts."""
+    # Membership changes rarely, so the set is cached much longer than balances
+    validators = await cached(
+        VALIDATORS_KEY, settings.validators_cache_ttl, lambda: _load_validators(session)
+    )
+    addresses = [v["address"] for v in validators]
+
+    # Overlay balances the node reported within the balance cache TTL
+    node_data = await get_cached_balances(addresses)
+    for validator in validators:
+        data = node_data.get(validator["address"])
+        if data:
+            validator["balance"] = format_big_int(Decimal(str(data.get("balance", 0))))
+            validator["nonce"] = data.get("nonce", validator["nonce"])
+
+    balance_refresher.enqueue(addresses)
+
+    return {"validators": validators}
+
+
+async def _load_validators(session: AsyncSession) -> list[dict]:
+    """Load validator accounts from the database."""
     result = await session.execute(
-        select(Account)
+        select(*_ACCOUNT_LIST_COLUMNS, Account.validator_info)
         .where(Account.is_validator == True)
         .order_by(desc(Account.balance))
     )
-    validators = result.scalars().all()
-
-    node_data = await fetch_balances_batch([account.address for account in validators])
-    if node_data:
-        updated = False
-        now = datetime.utcnow()
-        for account in validators:
-            data = node_data.get(account.address)
-            if not data:
-                continue
-            account.balance = Decimal(str(data.get("balance", 0)))
-            account.nonce = data.get("nonce", account.nonce)
-            account.updated_at = now
-            updated = True
-        if updated:
-            await session.commit()
-
-    return {"validators": [_account_to_dict(a, include_validator_info=True) for a in validators]}
+    return [_account_to_dict(a, include_validator_info=True) for a in result.all()]
 
 
 @router.get("/{address}")
@@ -178,27 +129,22 @@ async def get_account(
     session: AsyncSession = Depends(get_session),
 ):
     """Get account by address with live balance from node."""
-    result = await session.execute(
-        select(Account).where(Account.address == address)
+    # Stored account, live balance from node and tx counts are independent
+    account, node_data, counts_result = await asyncio.gather(
+        fetch_scalar(select(Account).where(Account.address == address)),
+        fetch_balance_from_node(address),
+        session.execute(
+            select(
+                func.count().filter(Transaction.from_address == address),
+                func.count().filter(Transaction.to_address == address),
+            ).where(or_(Transaction.from_address == address, Transaction.to_address == address))
+        ),
     )
-    account = result.scalar_one_or_none()
-
-    # Fetch live balance from node
-    node_data = await fetch_balance_from_node(address)
 
     if not account and not node_data:
         raise HTTPException(status_code=404, detail="Account not found")
 
-    # Calculate tx counts from DB
-    sent_result = await session.execute(
-        select(func.count(Transaction.id)).where(Transaction.from_address == address)
-    )
-    sent_count = sent_result.scalar() or 0
-
-    recv_result = await session.execute(
-        select(func.count(Transaction.id)).where(Transaction.to_address == address)
-    )
-    recv_count = recv_result.scalar() or 0
+    sent_count, recv_count = counts_result.one()
 
     # If we have node data, update/create account with fresh balance
     if node_data:
@@ -212,21 +158,33 @@ async def get_account(
             tx_count=sent_count + recv_count,
             tx_sent_count=sent_count,
             tx_received_count=recv_count,
-            updated_at=datetime.utcnow(),
-        ).on_conflict_do_update(
+            updated_at=utcnow(),
+        )
+        # Reuse the inserted values so each one is bound only once
+        stmt = stmt.on_conflict_do_update(
             index_elements=["address"],
             set_={
-                "balance": balance,
-                "nonce": nonce,
-                "tx_count": sent_count + recv_count,
-                "tx_sent_count": sent_count,
-                "tx_received_count": recv_count,
-                "updated_at": datetime.utcnow(),
+                "balance": stmt.excluded.balance,
+                "nonce": stmt.excluded.nonce,
+                "tx_count": stmt.excluded.tx_count,
+                "tx_sent_count": stmt.excluded.tx_sent_count,
+                "tx_received_count": stmt.excluded.tx_received_count,
+                "updated_at": stmt.excluded.updated_at,
             }
-        )
-        await session.execute(stmt)
+        ).returning(literal_column("xmax = 0"))  # true when the row was inserted
+        result = await session.execute(stmt)
+        if result.scalar():
+            # Plain UPDATE: an unseeded counter is left for the indexer to seed from COUNT(*)
+            await session.execute(
+                update(Counter)
+                .where(Counter.key == ACCOUNTS_TOTAL)
+                .values(value=Counter.value + 1)
+            )
         await session.commit()
 
+        # Drop the cached balance so list pages pick up the fresh value
+        await invalidate(balance_key(address))
+
         # Re-fetch updated account
         result = await session.execute(
             select(Account).where(Account.address == address)
@@ -242,6 +200,7 @@ async def get_account_transactions(
     page: int = Query(1, ge=1),
     limit: int = Query(settings.default_page_size, ge=1, le=settings.max_page_size),
     direction: Optional[str] = Query(None, description="Filter: sent, received, or all"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from a previous page's next_cursor"),
     session: AsyncSession = Depends(get_session),
 ):
     """Get transactions for an account."""
@@ -249,31 +208,31 @@ async def get_account_transactions(
 
     # Build query based on direction
     if direction == "sent":
-        query = select(Transaction).where(Transaction.from_address == address)
-        count_query = select(func.count(Transaction.id)).where(Transaction.from_address == address)
+        query = select(*TX_LIST_COLUMNS).where(Transaction.from_address == address)
     elif direction == "received":
-        query = select(Transaction).where(Transaction.to_address == address)
-        count_query = select(func.count(Transaction.id)).where(Transaction.to_address == address)
+        query = select(*TX_LIST_COLUMNS).where(Transaction.to_address == address)
     else:
-        query = select(Transaction).where(
-            or_(Transaction.from_address == address, Transaction.to_address == address)
-        )
-        count_query = select(func.count(Transaction.id)).where(
-            or_(Transaction.from_address == address, Transaction.to_address == address)
-        )
-
-    # Get total count
-    count_result = await session.execute(count_query)
-    total = count_result.scalar()
-
-    # Get transactions
-    result = await session.execute(
-        query
-        .order_by(desc(Transaction.block_height), desc(Transaction.tx_index))
-        .offset(offset)
-        .limit(limit)
-    )
-    txs = result.scalars().all()
+        # Two index range scans instead of an OR; self-transfers come from the first branch
+        both = union_all(
+            select(*TX_LIST_COLUMNS).where(Transaction.from_address == address),
+            select(*TX_LIST_COLUMNS).where(
+                Transaction.to_address == address, Transaction.from_address != address
+            ),
+        ).subquery()
+        query = select(both)
+
+    keyset = (query.selected_columns.block_height, query.selected_columns.tx_index)
+    query = query.order_by(*(desc(c) for c in keyset))
+
+    if cursor:
+        query = after_cursor(query, cursor, keyset, (int, int))
+        txs = await fetch_after(session, query, limit)
+        pagination = {"limit": limit}
+    else:
+        # Get transactions with total count
+        txs, total = await fetch_page(session, query, offset, limit)
+        pagination = page_info(page, limit, total)
+    pagination["next_cursor"] = next_cursor(txs, limit, "block_height", "tx_index")
 
     return {
         "transactions": [
@@ -283,35 +242,22 @@ async def get_account_transactions(
                 "tx_type": tx.tx_type.value,
                 "from_address": tx.from_address,
                 "to_address": tx.to_address,
-                "amount": str(tx.amount),
-                "fee": str(tx.fee),
+                "amount": format_big_int(tx.amount),
+                "fee": format_big_int(tx.fee),
                 "nonce": tx.nonce,
                 "direction": "sent" if tx.from_address == address else "received",
             }
             for tx in txs
         ],
-        "pagination": {
-            "page": page,
-            "limit": limit,
-            "total": total,
-            "pages": (total + limit - 1) // limit if total > 0 else 0,
-        }
+        "pagination": pagination,
     }
 
 
-def _format_big_int(value) -> str:
-    """Format large numbers without scientific notation."""
-    if value is None:
-        return "0"
-    # Use format with 'f' to avoid scientific notation, then strip trailing zeros and decimal point
-    return format(value, 'f').rstrip('0').rstrip('.')
-
-
 def _account_to_dict(account: Account, detailed: bool = False, include_validator_info: bool = False) -> dict:
     """Convert account to dictionary."""
     data = {
         "address": account.address,
-        "balance": _format_big_int(account.balance),
+        "balance": format_big_int(account.balance),
         "nonce": account.nonce,
         "tx_count": account.tx_count,
         "is_validator": account.is_validator,
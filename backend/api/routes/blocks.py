@@ -1,39 +1,56 @@
 """Block API endpoints."""
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select, func, desc
+from sqlalchemy import select, desc, bindparam
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from typing import Optional
 
 from core.database import get_session
 from core.config import get_settings
-from models import Block, Transaction
+from core.utils import format_big_int
+from models import Block, Transaction, BLOCKS_TOTAL
+from ..pagination import after_cursor, fetch_after, fetch_page, next_cursor, page_info
+from .transactions import TX_LIST_COLUMNS
 
 router = APIRouter(prefix="/blocks", tags=["blocks"])
 settings = get_settings()
 
+# Columns read by the list responses; avoids hydrating full ORM objects
+_BLOCK_LIST_COLUMNS = (
+    Block.height, Block.hash, Block.timestamp, Block.proposer_address,
+    Block.tx_count, Block.gas_used, Block.gas_limit,
+)
+_BLOCK_TX_COLUMNS = TX_LIST_COLUMNS + (Transaction.gas_price, Transaction.gas_limit)
+
+# Hot-path statements, built once and executed with bound parameters
+_LATEST_BLOCK_STMT = select(Block).order_by(desc(Block.height)).limit(1)
+_BLOCK_BY_HEIGHT_STMT = (
+    select(Block).options(selectinload(Block.transactions)).where(Block.height == bindparam("height"))
+)
+_BLOCK_BY_HASH_STMT = (
+    select(Block).options(selectinload(Block.transactions)).where(Block.hash == bindparam("hash"))
+)
+
 
 @router.get("")
 async def get_blocks(
     page: int = Query(1, ge=1),
     limit: int = Query(settings.default_page_size, ge=1, le=settings.max_page_size),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from a previous page's next_cursor"),
     session: AsyncSession = Depends(get_session),
 ):
     """Get paginated list of blocks."""
     offset = (page - 1) * limit
+    query = select(*_BLOCK_LIST_COLUMNS).order_by(desc(Block.height))
 
-    # Get total count
-    count_result = await session.execute(select(func.count(Block.id)))
-    total = count_result.scalar()
-
-    # Get blocks
-    result = await session.execute(
-        select(Block)
-        .order_by(desc(Block.height))
-        .offset(offset)
-        .limit(limit)
-    )
-    blocks = result.scalars().all()
+    if cursor:
+        blocks = await fetch_after(session, after_cursor(query, cursor, (Block.height,), (int,)), limit)
+        pagination = {"limit": limit}
+    else:
+        # Get blocks with total count
+        blocks, total = await fetch_page(session, query, offset, limit, counter=BLOCKS_TOTAL)
+        pagination = page_info(page, limit, total)
+    pagination["next_cursor"] = next_cursor(blocks, limit, "height")
 
     return {
         "blocks": [
@@ -48,21 +65,14 @@ async def get_blocks(
             }
             for b in blocks
         ],
-        "pagination": {
-            "page": page,
-            "limit": limit,
-            "total": total,
-            "pages": (total + limit - 1) // limit,
-        }
+        "pagination": pagination,
     }
 
 
 @router.get("/latest")
 async def get_latest_block(session: AsyncSession = Depends(get_session)):
     """Get latest block."""
-    result = await session.execute(
-        select(Block).order_by(desc(Block.height)).limit(1)
-    )
+    result = await session.execute(_LATEST_BLOCK_STMT)
     block = result.scalar_one_or_none()
 
     if not block:
@@ -79,17 +89,9 @@ async def get_block(
     """Get block by height or hash."""
     # Try to parse as height
     if height_or_hash.isdigit():
-        result = await session.execute(
-            select(Block)
-            .options(selectinload(Block.transactions))
-            .where(Block.height == int(height_or_hash))
-        )
+        result = await session.execute(_BLOCK_BY_HEIGHT_STMT, {"height": int(height_or_hash)})
     else:
-        result = await session.execute(
-            select(Block)
-            .options(selectinload(Block.transactions))
-            .where(Block.hash == height_or_hash)
-        )
+        result = await session.execute(_BLOCK_BY_HASH_STMT, {"hash": height_or_hash})
 
     block = result.scalar_one_or_none()
 
@@ -109,37 +111,28 @@ async def get_block_transactions(
     """Get transactions in a block."""
     offset = (page - 1) * limit
 
-    # Check block exists
+    # Check block exists; its denormalized tx_count is the total
     block_result = await session.execute(
-        select(Block).where(Block.height == height)
+        select(Block.tx_count).where(Block.height == height)
     )
-    if not block_result.scalar_one_or_none():
+    block = block_result.first()
+    if not block:
         raise HTTPException(status_code=404, detail="Block not found")
-
-    # Get total count
-    count_result = await session.execute(
-        select(func.count(Transaction.id)).where(Transaction.block_height == height)
-    )
-    total = count_result.scalar()
+    total = block.tx_count or 0
 
     # Get transactions
     result = await session.execute(
-        select(Transaction)
+        select(*_BLOCK_TX_COLUMNS)
         .where(Transaction.block_height == height)
         .order_by(Transaction.tx_index)
         .offset(offset)
         .limit(limit)
     )
-    txs = result.scalars().all()
+    txs = result.all()
 
     return {
         "transactions": [_tx_to_dict(tx) for tx in txs],
-        "pagination": {
-            "page": page,
-            "limit": limit,
-            "total": total,
-            "pages": (total + limit - 1) // limit,
-        }
+        "pagination": page_info(page, limit, total),
     }
 
 
@@ -177,8 +170,8 @@ def _tx_to_dict(tx: Transaction) -> dict:
         "tx_type": tx.tx_type.value,
         "from_address": tx.from_address,
         "to_address": tx.to_address,
-        "amount": str(tx.amount),
-        "fee": str(tx.fee),
+        "amount": format_big_int(tx.amount),
+        "fee": format_big_int(tx.fee),
         "nonce": tx.nonce,
         "gas_price": tx.gas_price,
         "gas_limit": tx.gas_limit,
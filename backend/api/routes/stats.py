@@ -1,66 +1,65 @@
 """Statistics API endpoints."""
 from fastapi import APIRouter, Depends
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy import select, func, desc
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta
-
-from core.database import get_session
-from models import Block, Transaction, Account, SyncStatus, TxType
+import asyncio
+import orjson
+
+from core.cache import STATS_OVERVIEW_KEY, cached, get_cached, store
+from core.config import get_settings
+from core.utils import format_big_int, utcnow
+from core.database import async_session_maker, fetch_scalar, get_session
+from models import (
+    Block, Transaction, Account, SyncStatus, TxType,
+    Counter, BLOCKS_TOTAL, TRANSACTIONS_TOTAL, ACCOUNTS_TOTAL,
+)
 
 router = APIRouter(prefix="/stats", tags=["statistics"])
-
-
-def _format_big_int(value) -> str:
-    """Format large numbers without scientific notation."""
-    if value is None:
-        return "0"
-    return format(value, 'f').rstrip('0').rstrip('.')
+settings = get_settings()
 
 
 @router.get("")
-async def get_stats(session: AsyncSession = Depends(get_session)):
+async def get_stats():
     """Get overall blockchain statistics."""
-    # Block stats
-    block_count = await session.execute(select(func.count(Block.id)))
-    latest_block = await session.execute(
-        select(Block).order_by(desc(Block.height)).limit(1)
+    return await cached(STATS_OVERVIEW_KEY, settings.stats_cache_ttl, _compute_stats)
+
+
+async def _compute_stats() -> dict:
+    """Compute overall blockchain statistics."""
+    # Each query runs on its own pooled connection, concurrently
+    block_count, block, tx_count, account_count, total_transferred, total_fees, sync = await asyncio.gather(
+        # Block stats
+        _count(BLOCKS_TOTAL, Block.id),
+        fetch_scalar(select(Block).order_by(desc(Block.height)).limit(1)),
+        # Transaction stats
+        _count(TRANSACTIONS_TOTAL, Transaction.id),
+        # Account stats
+        _count(ACCOUNTS_TOTAL, Account.id),
+        # Total value transferred
+        fetch_scalar(
+            select(func.sum(Transaction.amount)).where(Transaction.tx_type == TxType.TRANSFER)
+        ),
+        # Total fees
+        fetch_scalar(select(func.sum(Transaction.fee))),
+        # Sync status
+        fetch_scalar(select(SyncStatus).where(SyncStatus.key == "last_indexed_height")),
     )
 
-    # Transaction stats
-    tx_count = await session.execute(select(func.count(Transaction.id)))
-
-    # Account stats
-    account_count = await session.execute(select(func.count(Account.id)))
-
-    # Total value transferred
-    total_transferred = await session.execute(
-        select(func.sum(Transaction.amount)).where(Transaction.tx_type == TxType.TRANSFER)
-    )
-
-    # Total fees
-    total_fees = await session.execute(select(func.sum(Transaction.fee)))
-
-    # Sync status
-    sync_status = await session.execute(
-        select(SyncStatus).where(SyncStatus.key == "last_indexed_height")
-    )
-
-    block = latest_block.scalar_one_or_none()
-    sync = sync_status.scalar_one_or_none()
-
     return {
         "blocks": {
-            "total": block_count.scalar() or 0,
+            "total": block_count or 0,
             "latest_height": block.height if block else 0,
             "latest_timestamp": block.timestamp if block else 0,
         },
         "transactions": {
-            "total": tx_count.scalar() or 0,
-            "total_transferred": _format_big_int(total_transferred.scalar() or 0),
-            "total_fees": _format_big_int(total_fees.scalar() or 0),
+            "total": tx_count or 0,
+            "total_transferred": format_big_int(total_transferred or 0),
+            "total_fees": format_big_int(total_fees or 0),
         },
         "accounts": {
-            "total": account_count.scalar() or 0,
+            "total": account_count or 0,
         },
         "sync": {
             "indexed_height": int(sync.value) if sync else 0,
@@ -69,9 +68,24 @@ async def get_stats(session: AsyncSession = Depends(get_session)):
     }
 
 
+async def _count(key: str, column) -> int:
+    """Read an indexer-maintained row count, counting rows if it is not seeded yet."""
+    value = await fetch_scalar(select(Counter.value).where(Counter.key == key))
+    if value is None:
+        value = await fetch_scalar(select(func.count(column)))
+    return value
+
+
 @router.get("/tx-types")
 async def get_tx_type_stats(session: AsyncSession = Depends(get_session)):
     """Get transaction counts by type."""
+    return await cached(
+        "stats:tx-types", settings.stats_cache_ttl, lambda: _compute_tx_type_stats(session)
+    )
+
+
+async def _compute_tx_type_stats(session: AsyncSession) -> dict:
+    """Compute transaction counts by type."""
     result = await session.execute(
         select(Transaction.tx_type, func.count(Transaction.id))
         .group_by(Transaction.tx_type)
@@ -88,15 +102,20 @@ async def get_tx_type_stats(session: AsyncSession = Depends(get_session)):
 @router.get("/tps")
 async def get_tps_stats(session: AsyncSession = Depends(get_session)):
     """Get TPS statistics."""
+    return await cached("stats:tps", settings.stats_tps_cache_ttl, lambda: _compute_tps_stats(session))
+
+
+async def _compute_tps_stats(session: AsyncSession) -> dict:
+    """Compute TPS statistics."""
     # Get blocks from last hour
-    one_hour_ago = datetime.utcnow() - timedelta(hours=1)
+    one_hour_ago = utcnow() - timedelta(hours=1)
 
     result = await session.execute(
-        select(Block)
+        select(Block.timestamp, Block.tx_count)
         .where(Block.indexed_at >= one_hour_ago)
         .order_by(Block.height)
     )
-    blocks = result.scalars().all()
+    blocks = result.all()
 
     if len(blocks) < 2:
         return {
@@ -132,39 +151,52 @@ async def get_tps_stats(session: AsyncSession = Depends(get_session)):
 
 
 @router.get("/chart/blocks")
-async def get_block_chart(
-    hours: int = 24,
-    session: AsyncSession = Depends(get_session),
-):
+async def get_block_chart(hours: int = 24):
     """Get block production chart data."""
-    since = datetime.utcnow() - timedelta(hours=hours)
-
-    result = await session.execute(
-        select(Block)
+    key = f"stats:chart:blocks:{hours}"
+    payload = await get_cached(key)
+    if payload is not None:
+        return Response(payload, media_type="application/json")
+
+    return StreamingResponse(_stream_block_chart(hours, key), media_type="application/json")
+
+
+async def _stream_block_chart(hours: int, key: str):
+    """Stream block production chart JSON row by row, caching the full payload."""
+    since = utcnow() - timedelta(hours=hours)
+
+    # Group by hour in the database (block timestamps are unix seconds)
+    hour_start = ((Block.timestamp // 3600) * 3600).label("hour_start")
+    stmt = (
+        select(
+            hour_start,
+            func.count().label("blocks"),
+            func.sum(Block.tx_count).label("txs"),
+            func.sum(Block.gas_used).label("gas"),
+        )
         .where(Block.indexed_at >= since)
-        .order_by(Block.height)
+        .group_by(hour_start)
+        .order_by(hour_start)
     )
-    blocks = result.scalars().all()
-
-    # Group by hour
-    hourly_data = {}
-    for block in blocks:
-        hour_key = datetime.fromtimestamp(block.timestamp).replace(minute=0, second=0, microsecond=0)
-        if hour_key not in hourly_data:
-            hourly_data[hour_key] = {"blocks": 0, "txs": 0, "gas": 0}
-        hourly_data[hour_key]["blocks"] += 1
-        hourly_data[hour_key]["txs"] += block.tx_count
-        hourly_data[hour_key]["gas"] += block.gas_used
 
-    return {
-        "chart": [
-            {
-                "timestamp": int(hour.timestamp()),
-                "hour": hour.isoformat(),
-                "blocks": data["blocks"],
-                "transactions": data["txs"],
-                "gas_used": data["gas"],
-            }
-            for hour, data in sorted(hourly_data.items())
-        ]
-    }
+    # Own session: yield dependencies are closed before a streamed body is sent
+    pieces = [b'{"chart":[']
+    yield pieces[0]
+    async with async_session_maker() as session:
+        result = await session.stream(stmt)
+        async for row in result:
+            piece = orjson.dumps({
+                "timestamp": int(row.hour_start),
+                "hour": datetime.fromtimestamp(row.hour_start).isoformat(),
+                "blocks": row.blocks,
+                "transactions": int(row.txs or 0),
+                "gas_used": int(row.gas or 0),
+            })
+            if len(pieces) > 1:
+                piece = b"," + piece
+            pieces.append(piece)
+            yield piece
+    yield b"]}"
+
+    pieces.append(b"]}")
+    await store(key, b"".join(pieces).decode(), settings.stats_chart_cache_ttl)
@@ -1,16 +1,35 @@
 """Transaction API endpoints."""
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select, func, desc, or_
+from sqlalchemy import select, desc, or_, bindparam
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 
 from core.database import get_session
 from core.config import get_settings
-from models import Transaction, TxType
+from core.utils import format_big_int
+from models import Transaction, TxType, TRANSACTIONS_TOTAL
+from ..pagination import after_cursor, fetch_after, fetch_page, next_cursor, page_info
 
 router = APIRouter(prefix="/transactions", tags=["transactions"])
 settings = get_settings()
 
+# Keyset used for cursor pagination, matching the list ordering
+_KEYSET = (Transaction.block_height, Transaction.tx_index)
+
+# Columns read by transaction list responses, shared by the block and
+# account routes; avoids hydrating full ORM objects
+TX_LIST_COLUMNS = (
+    Transaction.hash, Transaction.block_height, Transaction.tx_type,
+    Transaction.from_address, Transaction.to_address, Transaction.amount, Transaction.fee,
+    Transaction.nonce, Transaction.tx_index,
+)
+
+# Hot-path statements, built once and executed with bound parameters
+_RECENT_TXS_STMT = (
+    select(*TX_LIST_COLUMNS).order_by(desc(Transaction.block_height), desc(Transaction.tx_index))
+)
+_TX_BY_HASH_STMT = select(Transaction).where(Transaction.hash == bindparam("hash"))
+
 
 @router.get("")
 async def get_transactions(
@@ -18,20 +37,19 @@ async def get_transactions(
     limit: int = Query(settings.default_page_size, ge=1, le=settings.max_page_size),
     tx_type: Optional[str] = Query(None, description="Filter by transaction type"),
     address: Optional[str] = Query(None, description="Filter by address (from or to)"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from a previous page's next_cursor"),
     session: AsyncSession = Depends(get_session),
 ):
     """Get paginated list of transactions."""
     offset = (page - 1) * limit
 
     # Build query
-    query = select(Transaction)
-    count_query = select(func.count(Transaction.id))
+    query = select(*TX_LIST_COLUMNS)
 
     if tx_type:
         try:
             tx_type_enum = TxType(tx_type)
             query = query.where(Transaction.tx_type == tx_type_enum)
-            count_query = count_query.where(Transaction.tx_type == tx_type_enum)
         except ValueError:
             raise HTTPException(status_code=400, detail=f"Invalid tx_type: {tx_type}")
 
@@ -42,51 +60,45 @@ async def get_transactions(
                 Transaction.to_address == address
             )
         )
-        count_query = count_query.where(
-            or_(
-                Transaction.from_address == address,
-                Transaction.to_address == address
-            )
-        )
 
-    # Get total count
-    count_result = await session.execute(count_query)
-    total = count_result.scalar()
-
-    # Get transactions
-    result = await session.execute(
-        query
-        .order_by(desc(Transaction.block_height), desc(Transaction.tx_index))
-        .offset(offset)
-        .limit(limit)
-    )
-    txs = result.scalars().all()
+    query = query.order_by(desc(Transaction.block_height), desc(Transaction.tx_index))
+
+    if cursor:
+        # Keyset page: no total, cost independent of depth
+        txs = await fetch_after(session, after_cursor(query, cursor, _KEYSET, (int, int)), limit)
+        pagination = {"limit": limit}
+    else:
+        # Get transactions with total count
+        txs, total = await fetch_page(
+            session, query, offset, limit,
+            counter=None if tx_type or address else TRANSACTIONS_TOTAL,
+        )
+        pagination = page_info(page, limit, total)
+    pagination["next_cursor"] = next_cursor(txs, limit, "block_height", "tx_index")
 
     return {
         "transactions": [_tx_to_dict(tx) for tx in txs],
-        "pagination": {
-            "page": page,
-            "limit": limit,
-            "total": total,
-            "pages": (total + limit - 1) // limit if total > 0 else 0,
-        }
+        "pagination": pagination,
     }
 
 
 @router.get("/recent")
 async def get_recent_transactions(
     limit: int = Query(10, ge=1, le=50),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from a previous next_cursor"),
     session: AsyncSession = Depends(get_session),
 ):
     """Get most recent transactions."""
-    result = await session.execute(
-        select(Transaction)
-        .order_by(desc(Transaction.block_height), desc(Transaction.tx_index))
-        .limit(limit)
-    )
-    txs = result.scalars().all()
+    query = _RECENT_TXS_STMT
+    if cursor:
+        query = after_cursor(query, cursor, _KEYSET, (int, int))
 
-    return {"transactions": [_tx_to_dict(tx) for tx in txs]}
+    txs = await fetch_after(session, query, limit)
+
+    return {
+        "transactions": [_tx_to_dict(tx) for tx in txs],
+        "next_cursor": next_cursor(txs, limit, "block_height", "tx_index"),
+    }
 
 
 @router.get("/types")
@@ -101,9 +113,7 @@ async def get_transaction(
     session: AsyncSession = Depends(get_session),
 ):
     """Get transaction by hash."""
-    result = await session.execute(
-        select(Transaction).where(Transaction.hash == hash)
-    )
+    result = await session.execute(_TX_BY_HASH_STMT, {"hash": hash})
     tx = result.scalar_one_or_none()
 
     if not tx:
@@ -112,13 +122,6 @@ async def get_transaction(
     return _tx_to_dict(tx, detailed=True)
 
 
-def _format_big_int(value) -> str:
-    """Format large numbers without scientific notation."""
-    if value is None:
-        return "0"
-    return format(value, 'f').rstrip('0').rstrip('.')
-
-
 def _tx_to_dict(tx: Transaction, detailed: bool = False) -> dict:
     """Convert transaction to dictionary."""
     data = {
@@ -127,8 +130,8 @@ def _tx_to_dict(tx: Transaction, detailed: bool = False) -> dict:
         "tx_type": tx.tx_type.value,
         "from_address": tx.from_address,
         "to_address": tx.to_address,
-        "amount": _format_big_int(tx.amount),
-        "fee": _format_big_int(tx.fee),
+        "amount": format_big_int(tx.amount),
+        "fee": format_big_int(tx.fee),
         "nonce": tx.nonce,
         "tx_index": tx.tx_index,
     }
@@ -0,0 +1,70 @@
+"""Redis cache client."""
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Optional
+import json
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+
+from .config import get_settings
+
+settings = get_settings()
+
+# Cached /stats payload, invalidated by the indexer on every committed batch
+STATS_OVERVIEW_KEY = "stats:overview"
+
+# Cached validator set, invalidated by the indexer on validator-affecting txs
+VALIDATORS_KEY = "validators:list"
+
+
+@lru_cache()
+def get_redis() -> redis.Redis:
+    """Get cached Redis client instance."""
+    return redis.from_url(
+        settings.redis_url,
+        decode_responses=True,
+        socket_timeout=settings.redis_socket_timeout,
+        socket_connect_timeout=settings.redis_connect_timeout,
+    )
+
+
+async def close_redis():
+    """Close the shared Redis client."""
+    await get_redis().aclose()
+
+
+async def get_cached(key: str) -> Optional[str]:
+    """Return the raw value cached under `key`; Redis errors count as a miss."""
+    try:
+        return await get_redis().get(key)
+    except RedisError:
+        return None
+
+
+async def store(key: str, value: str, ttl: int):
+    """Cache a raw value under `key`, ignoring Redis errors."""
+    try:
+        await get_redis().set(key, value, ex=ttl)
+    except RedisError:
+        pass
+
+
+async def cached(key: str, ttl: int, compute: Callable[[], Awaitable[Any]]) -> Any:
+    """Return the JSON value cached under `key`, computing and storing it on a miss.
+
+    Redis errors are treated as a miss so the cache never fails a request.
+    """
+    value = await get_cached(key)
+    if value is not None:
+        return json.loads(value)
+
+    data = await compute()
+    await store(key, json.dumps(data), ttl)
+    return data
+
+
+async def invalidate(*keys: str):
+    """Delete cached keys, ignoring Redis errors."""
+    try:
+        await get_redis().delete(*keys)
+    except RedisError:
+        pass
@@ -10,8 +10,17 @@ settings = get_settings()
 engine = create_async_engine(
     settings.database_url,
     echo=False,
-    pool_size=10,
-    max_overflow=20,
+    query_cache_size=1200,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
+    pool_pre_ping=settings.db_pool_pre_ping,
+    connect_args={
+        "statement_cache_size": 1024,
+        "prepared_statement_cache_size": 256,
+        "server_settings": {} if settings.db_jit else {"jit": "off"},
+    },
 )
 
 async_session_maker = async_sessionmaker(
@@ -38,6 +47,18 @@ async def get_session() -> AsyncSession:
         yield session
 
 
+async def fetch_scalar(stmt):
+    """Execute a statement on its own short-lived session and return the scalar result.
+
+    A single AsyncSession runs statements one at a time; independent
+    queries issued through this helper can run concurrently on separate
+    pooled connections.
+    """
+    async with async_session_maker() as session:
+        result = await session.execute(stmt)
+        return result.scalar()
+
+
 @asynccontextmanager
 async def get_session_context():
     """Get database session as context manager."""
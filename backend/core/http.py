@@ -0,0 +1,98 @@
+"""Shared HTTP client for node requests."""
+from contextlib import asynccontextmanager
+from functools import lru_cache
+import asyncio
+import httpx
+
+from .config import get_settings
+
+settings = get_settings()
+
+
+class ServiceOverloadError(Exception):
+    """Node signalled overload (429/503) or timed out."""
+
+
+class AdaptiveLimiter:
+    """Concurrency limiter with a TCP-style window.
+
+    The window starts at one request, grows by one per success up to the
+    slow-start threshold and by 1/window after that, and halves when a
+    request raises ServiceOverloadError. Requests that were already in
+    flight when the window last shrank do not shrink it again, so a burst
+    of simultaneous timeouts halves it once rather than once per request.
+    """
+
+    def __init__(self, max_limit: int):
+        self.max_limit = max_limit
+        self.window = 1.0
+        self.threshold = float(max_limit)
+        self.in_flight = 0
+        self._epoch = 0  # bumped on every shrink
+        self._cond = asyncio.Condition()
+
+    @asynccontextmanager
+    async def acquire(self):
+        """Hold one slot of the window for the duration of a request."""
+        async with self._cond:
+            await self._cond.wait_for(lambda: self.in_flight < int(self.window))
+            self.in_flight += 1
+            epoch = self._epoch
+        try:
+            yield
+        except ServiceOverloadError:
+            if epoch == self._epoch:
+                self.threshold = max(1.0, self.window / 2)
+                self.window = self.threshold
+                self._epoch += 1
+            raise
+        else:
+            step = 1.0 if self.window < self.threshold else 1.0 / self.window
+            self.window = min(float(self.max_limit), self.window + step)
+        finally:
+            async with self._cond:
+                self.in_flight -= 1
+                self._cond.notify_all()
+
+
+# Request-path lookups and the background balance refresher get separate
+# windows, so a refresh fan-out cannot starve interactive requests
+node_limiter = AdaptiveLimiter(settings.node_max_concurrency)
+refresh_limiter = AdaptiveLimiter(settings.node_refresh_max_concurrency)
+
+
+@lru_cache()
+def get_http_client() -> httpx.AsyncClient:
+    """Get cached HTTP client instance."""
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=5.0,
+        limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+    )
+
+
+async def close_http_client():
+    """Close the shared HTTP client."""
+    await get_http_client().aclose()
+
+
+async def node_request(
+    method: str,
+    url: str,
+    *,
+    limiter: AdaptiveLimiter = node_limiter,
+    **kwargs,
+) -> httpx.Response:
+    """Send a request to the node through the shared client and a limiter.
+
+    Raises ServiceOverloadError on timeouts and 429/503 responses so the
+    limiter can shrink its window.
+    """
+    async with limiter.acquire():
+        try:
+            resp = await get_http_client().request(method, url, **kwargs)
+        except httpx.TimeoutException as e:
+            raise ServiceOverloadError(f"{method} {url} timed out") from e
+        if resp.status_code in (429, 503):
+            raise ServiceOverloadError(f"{method} {url} returned {resp.status_code}")
+        return resp
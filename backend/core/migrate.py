@@ -0,0 +1,57 @@
+"""Build indexes added to models after their tables already existed.
+
+`init_db` only creates missing tables (with their indexes). On an existing
+deployment, run this once after upgrading:
+
+    python -m core.migrate
+
+Builds run CONCURRENTLY so the indexer and API keep working meanwhile.
+"""
+import asyncio
+import logging
+import sys
+
+from sqlalchemy import text
+
+import models  # noqa: F401  (registers the tables on Base.metadata)
+from .database import Base, engine
+
+logger = logging.getLogger(__name__)
+
+_INVALID_INDEXES = text(
+    "SELECT c.relname FROM pg_index i "
+    "JOIN pg_class c ON c.oid = i.indexrelid "
+    "WHERE NOT i.indisvalid"
+)
+
+
+def _create_missing_indexes(connection):
+    """Create missing model indexes, rebuilding any left INVALID by a failed build."""
+    invalid = set(connection.execute(_INVALID_INDEXES).scalars().all())
+
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            if index.name in invalid:
+                logger.warning(f"Dropping invalid index {index.name}")
+                connection.execute(text(f'DROP INDEX CONCURRENTLY IF EXISTS "{index.name}"'))
+
+            options = index.dialect_options["postgresql"]
+            options["concurrently"] = True
+            try:
+                index.create(connection, checkfirst=True)
+            finally:
+                options["concurrently"] = False
+
+
+async def create_missing_indexes():
+    """Create missing indexes on an autocommit connection."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.run_sync(_create_missing_indexes)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, stream=sys.stdout)
+    asyncio.run(create_missing_indexes())
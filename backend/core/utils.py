@@ -0,0 +1,17 @@
+"""Shared helpers."""
+from datetime import datetime, timezone
+
+
+def utcnow() -> datetime:
+    """Current UTC time as a naive datetime, matching the DateTime columns."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def format_big_int(value) -> str:
+    """Format large numbers without scientific notation."""
+    if value is None:
+        return "0"
+    if isinstance(value, int):
+        return str(value)
+    # Use format with 'f' to avoid scientific notation, then strip trailing zeros and decimal point
+    return format(value, 'f').rstrip('0').rstrip('.')
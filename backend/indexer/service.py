@@ -5,12 +5,17 @@ from decimal import Decimal
 from typing import Optional
 import logging
 
-from sqlalchemy import select, delete, func
+from sqlalchemy import select, delete, func, literal, literal_column, text, table, column
 from sqlalchemy.dialects.postgresql import insert
 
+from core.cache import STATS_OVERVIEW_KEY, VALIDATORS_KEY, close_redis, invalidate
 from core.config import get_settings
 from core.database import get_session_context
-from models import Block, Transaction, TxType, Account, SyncStatus
+from core.utils import utcnow
+from models import (
+    Block, Transaction, TxType, Account, SyncStatus,
+    Counter, BLOCKS_TOTAL, TRANSACTIONS_TOTAL, ACCOUNTS_TOTAL,
+)
 from .client import BlockchainClient
 
 logger = logging.getLogger(__name__)
@@ -19,6 +24,54 @@ settings = get_settings()
 # Batch size for parallel block fetching
 BATCH_SIZE = 50
 
+# Fetched batches that may wait for the database writer
+SYNC_PIPELINE_DEPTH = 3
+
+# Rows per multi-row account upsert
+ACCOUNT_UPSERT_CHUNK_SIZE = 5000
+
+# Above this many addresses, stage them with COPY instead of a VALUES upsert
+ACCOUNT_COPY_THRESHOLD = 1000
+
+# Per-connection staging table for COPY. Rows are cleared on commit but the table
+# is kept, so prepared statements that reference it stay valid across batches.
+_CREATE_ACCOUNTS_STAGE = text(
+    "CREATE TEMP TABLE IF NOT EXISTS accounts_stage ("
+    "address text PRIMARY KEY, last_seen_height bigint, last_seen_at timestamp"
+    ") ON COMMIT DELETE ROWS"
+)
+_accounts_stage = table(
+    "accounts_stage",
+    column("address"),
+    column("last_seen_height"),
+    column("last_seen_at"),
+)
+
+# Hot-path statements, built once at import
+_BLOCK_INSERT_STMT = insert(Block)
+_TX_INSERT_STMT = insert(Transaction)
+_ASYNC_COMMIT = text("SET LOCAL synchronous_commit = off")
+
+# Enum lookups and constants for the per-row loops
+_TX_TYPE_MAP = {member.value: member for member in TxType}
+_ZERO = Decimal(0)
+
+# Transaction types that can change validator set membership
+VALIDATOR_TX_TYPES = {"STAKE", "UNSTAKE", "UPDATE_VALIDATOR", "UNJAIL"}
+
+
+def _numeric(value, field: str, tx_hash: str, height: int) -> int | str | Decimal:
+    """Prepare a uint256 amount for a Numeric(78, 0) column.
+
+    Ints, numeric strings and Decimals are exact and passed through. A float
+    has already lost precision; it is stored as its Decimal value and logged
+    rather than failing the whole batch.
+    """
+    if isinstance(value, float):
+        logger.warning(f"Inexact {field} {value!r} in tx {tx_hash} at height {height}")
+        return Decimal(str(value))
+    return value
+
 
 class IndexerService:
     """Service for indexing blockchain data."""
@@ -27,6 +80,10 @@ class IndexerService:
         self.client = BlockchainClient()
         self.running = False
         self.last_resync_time = 0
+        # Sole writer of the indexed height, so it is read from the DB only when
+        # first needed or after an error and kept in step with each commit
+        self.indexed_height: Optional[int] = None
+        self.prepared = False
 
     async def start(self):
         """Start the indexer."""
@@ -35,15 +92,22 @@ class IndexerService:
 
         while self.running:
             try:
+                # Inside the retry loop: the API may not have created the tables yet
+                if not self.prepared:
+                    await self._seed_counters()
+                    await self._check_hash_algo()
+                    self.prepared = True
                 await self._sync_loop()
             except Exception as e:
                 logger.error(f"Indexer error: {e}", exc_info=True)
+                self.indexed_height = None
                 await asyncio.sleep(5)
 
     async def stop(self):
         """Stop the indexer."""
         self.running = False
         await self.client.close()
+        await close_redis()
         logger.info("Indexer stopped")
 
     async def _sync_loop(self):
@@ -73,166 +137,310 @@ class IndexerService:
         await asyncio.sleep(settings.indexer_poll_interval)
 
     async def _get_indexed_height(self) -> int:
-        """Get last indexed block height."""
+        """Get last indexed block height, loading it from the DB if not cached."""
+        if self.indexed_height is None:
+            self.indexed_height = await self._load_indexed_height()
+        return self.indexed_height
+
+    async def _load_indexed_height(self) -> int:
+        """Read last indexed block height from the DB."""
         async with get_session_context() as session:
             result = await session.execute(
-                select(SyncStatus).where(SyncStatus.key == "last_indexed_height")
+                select(SyncStatus.value).where(SyncStatus.key == "last_indexed_height")
             )
-            status = result.scalar_one_or_none()
-            return int(status.value) if status else 0
+            value = result.scalar_one_or_none()
+            return int(value) if value else 0
 
     async def _set_indexed_height(self, session, height: int):
         """Set last indexed block height (within existing session)."""
-        stmt = insert(SyncStatus).values(
-            key="last_indexed_height",
-            value=str(height),
-            updated_at=datetime.utcnow()
-        ).on_conflict_do_update(
+        await self._set_status(session, "last_indexed_height", str(height))
+
+    async def _set_status(self, session, key: str, value: str):
+        """Upsert a sync status entry (within existing session)."""
+        stmt = insert(SyncStatus).values(key=key, value=value, updated_at=utcnow())
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["key"],
+            set_={"value": stmt.excluded.value, "updated_at": stmt.excluded.updated_at}
+        )
+        await session.execute(stmt)
+
+    async def _check_hash_algo(self):
+        """Drop indexed blocks if they were hashed with a different algorithm."""
+        async with get_session_context() as session:
+            result = await session.execute(
+                select(SyncStatus.value).where(SyncStatus.key == "hash_algo")
+            )
+            stored = result.scalar_one_or_none()
+            if stored == settings.indexer_hash_algo:
+                return
+
+            if stored is not None or await session.scalar(select(Block.id).limit(1)):
+                logger.warning(
+                    f"Hash algorithm changed ({stored or 'unknown'} -> "
+                    f"{settings.indexer_hash_algo}), resyncing from genesis"
+                )
+                await self._delete_from(session, 1)
+            await self._set_status(session, "hash_algo", settings.indexer_hash_algo)
+
+    async def _seed_counters(self):
+        """Initialize missing row counters from the tables they count."""
+        sources = {
+            BLOCKS_TOTAL: Block.id,
+            TRANSACTIONS_TOTAL: Transaction.id,
+            ACCOUNTS_TOTAL: Account.id,
+        }
+        async with get_session_context() as session:
+            result = await session.execute(select(Counter.key))
+            missing = set(sources) - set(result.scalars().all())
+            for key in missing:
+                count_result = await session.execute(select(func.count(sources[key])))
+                await session.execute(
+                    insert(Counter)
+                    .values(key=key, value=count_result.scalar())
+                    .on_conflict_do_nothing(index_elements=["key"])
+                )
+
+    async def _increment_counters(self, session, deltas: dict[str, int]):
+        """Add deltas to row counters (within existing session)."""
+        rows = [{"key": key, "value": delta} for key, delta in deltas.items() if delta]
+        if not rows:
+            return
+        stmt = insert(Counter).values(rows)
+        stmt = stmt.on_conflict_do_update(
             index_elements=["key"],
-            set_={"value": str(height), "updated_at": datetime.utcnow()}
+            set_={"value": Counter.value + stmt.excluded.value},
         )
         await session.execute(stmt)
 
     async def _sync_blocks_batch(self, start_height: int, end_height: int):
-        """Sync blocks in batches for better performance."""
+        """Sync blocks in batches, fetching ahead while earlier batches are written."""
         total = end_height - start_height + 1
-        processed = 0
-
-        for batch_start in range(start_height, end_height + 1, BATCH_SIZE):
-            batch_end = min(batch_start + BATCH_SIZE - 1, end_height)
-
-            # Fetch blocks in parallel
-            tasks = [
-                self.client.get_block(h)
-                for h in range(batch_start, batch_end + 1)
-            ]
-            blocks_data = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Filter successful fetches
-            valid_blocks = []
-            for i, block_data in enumerate(blocks_data):
-                height = batch_start + i
-                if isinstance(block_data, Exception):
-                    logger.error(f"Failed to fetch block {height}: {block_data}")
-                elif block_data is None:
-                    logger.warning(f"Block {height} returned None")
-                else:
-                    valid_blocks.append(block_data)
-
-            if not valid_blocks:
-                logger.error(f"No valid blocks in batch {batch_start}-{batch_end}")
-                break
-
-            # Index batch in single transaction
-            await self._index_blocks_batch(valid_blocks)
-            processed += len(valid_blocks)
-
-            logger.info(f"Indexed {processed}/{total} blocks (batch {batch_start}-{batch_end})")
-
-            # Small delay to avoid overwhelming the node
-            await asyncio.sleep(0.1)
+        # Bounded so the fetcher stays at most a few batches ahead of the writer
+        fetched: asyncio.Queue = asyncio.Queue(maxsize=SYNC_PIPELINE_DEPTH)
+
+        async def fetch_batches():
+            for batch_start in range(start_height, end_height + 1, BATCH_SIZE):
+                batch_end = min(batch_start + BATCH_SIZE - 1, end_height)
+                valid_blocks = await self._fetch_blocks(batch_start, batch_end)
+                await fetched.put((batch_start, batch_end, valid_blocks))
+                if not valid_blocks:
+                    return
+            await fetched.put(None)
+
+        async def index_batches():
+            processed = 0
+            while (batch := await fetched.get()) is not None:
+                batch_start, batch_end, valid_blocks = batch
+                if not valid_blocks:
+                    logger.error(f"No valid blocks in batch {batch_start}-{batch_end}")
+                    return
+
+                # Index batch in single transaction
+                await self._index_blocks_batch(valid_blocks)
+                processed += len(valid_blocks)
+
+                logger.info(f"Indexed {processed}/{total} blocks (batch {batch_start}-{batch_end})")
+
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(fetch_batches())
+            tg.create_task(index_batches())
+
+    async def _fetch_blocks(self, batch_start: int, batch_end: int) -> list[dict]:
+        """Fetch a range of blocks in parallel, skipping failed fetches."""
+        tasks = [
+            self.client.get_block(h)
+            for h in range(batch_start, batch_end + 1)
+        ]
+        blocks_data = await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Filter successful fetches
+        valid_blocks = []
+        for i, block_data in enumerate(blocks_data):
+            height = batch_start + i
+            if isinstance(block_data, Exception):
+                logger.error(f"Failed to fetch block {height}: {block_data}")
+            elif block_data is None:
+                logger.warning(f"Block {height} returned None")
+            else:
+                valid_blocks.append(block_data)
+        return valid_blocks
 
     async def _index_blocks_batch(self, blocks_data: list[dict]):
         """Index multiple blocks in a single database transaction."""
         if not blocks_data:
             return
 
+        # Hashed inline: each hash reads ~100 bytes, cheaper than shipping it to a worker
+        block_hashes = [self.client.compute_block_hash(block) for block in blocks_data]
+        tx_hashes = [self.client.compute_tx_hashes(block.get("txs", [])) for block in blocks_data]
+
+        # First pass: block rows
+        block_rows = [None] * len(blocks_data)
+        for i, block_data in enumerate(blocks_data):
+            header = block_data.get("header", {})
+            block_rows[i] = {
+                "height": header["height"],
+                "hash": block_hashes[i],
+                "prev_hash": header.get("prev_hash", ""),
+                "timestamp": header.get("timestamp", 0),
+                "chain_id": header.get("chain_id", ""),
+                "proposer_address": header.get("proposer_address", ""),
+                "tx_root": header.get("tx_root", ""),
+                "state_root": header.get("state_root", ""),
+                "compute_root": header.get("compute_root"),
+                "gas_used": header.get("gas_used", 0),
+                "gas_limit": header.get("gas_limit", 0),
+                "tx_count": len(block_data.get("txs", [])),
+                "zk_state_proof_hash": header.get("zk_state_proof_hash"),
+                "zk_compute_proof_hash": header.get("zk_compute_proof_hash"),
+                "pq_signature": block_data.get("pq_signature"),
+                "pq_sig_scheme_id": block_data.get("pq_sig_scheme_id"),
+            }
+        max_height = max(row["height"] for row in block_rows)
+
+        # Second pass: transaction rows, flattened across the batch
+        tx_rows = [None] * sum(row["tx_count"] for row in block_rows)
+        addresses_to_update = set()
+        validators_changed = False
+        pos = 0
+        for block_data, block_row, block_tx_hashes in zip(blocks_data, block_rows, tx_hashes):
+            height = block_row["height"]
+            for idx, tx_data in enumerate(block_data.get("txs", [])):
+                tx_rows[pos] = {
+                    "hash": block_tx_hashes[idx],
+                    "block_height": height,
+                    "tx_type": _TX_TYPE_MAP[tx_data.get("tx_type", "TRANSFER")],
+                    "from_address": tx_data.get("from_address", ""),
+                    "to_address": tx_data.get("to_address"),
+                    "amount": _numeric(tx_data.get("amount", 0), "amount", block_tx_hashes[idx], height),
+                    "fee": _numeric(tx_data.get("fee", 0), "fee", block_tx_hashes[idx], height),
+                    "nonce": tx_data.get("nonce", 0),
+                    "gas_price": tx_data.get("gas_price", 0),
+                    "gas_limit": tx_data.get("gas_limit", 0),
+                    "gas_used": tx_data.get("gas_limit", 0),
+                    "signature": tx_data.get("signature", ""),
+                    "pub_key": tx_data.get("pub_key", ""),
+                    "payload": tx_data.get("payload", {}),
+                    "tx_index": idx,
+                }
+                pos += 1
+
+                if tx_data.get("tx_type") in VALIDATOR_TX_TYPES:
+                    validators_changed = True
+
+                # Collect addresses for later batch update
+                if tx_data.get("from_address"):
+                    addresses_to_update.add(tx_data.get("from_address"))
+                if tx_data.get("to_address"):
+                    addresses_to_update.add(tx_data.get("to_address"))
+
         async with get_session_context() as session:
-            addresses_to_update = set()
-            max_height = 0
-
-            for block_data in blocks_data:
-                header = block_data.get("header", {})
-                txs = block_data.get("txs", [])
-                height = header["height"]
-                max_height = max(max_height, height)
-
-                block_hash = self.client.compute_block_hash(block_data)
-
-                # Create block record
-                block = Block(
-                    height=height,
-                    hash=block_hash,
-                    prev_hash=header.get("prev_hash", ""),
-                    timestamp=header.get("timestamp", 0),
-                    chain_id=header.get("chain_id", ""),
-                    proposer_address=header.get("proposer_address", ""),
-                    tx_root=header.get("tx_root", ""),
-                    state_root=header.get("state_root", ""),
-                    compute_root=header.get("compute_root"),
-                    gas_used=header.get("gas_used", 0),
-                    gas_limit=header.get("gas_limit", 0),
-                    tx_count=len(txs),
-                    zk_state_proof_hash=header.get("zk_state_proof_hash"),
-                    zk_compute_proof_hash=header.get("zk_compute_proof_hash"),
-                    pq_signature=block_data.get("pq_signature"),
-                    pq_sig_scheme_id=block_data.get("pq_sig_scheme_id"),
-                )
-                session.add(block)
-
-                # Index transactions
-                for idx, tx_data in enumerate(txs):
-                    tx_hash = self.client.compute_tx_hash(tx_data)
-                    tx = Transaction(
-                        hash=tx_hash,
-                        block_height=height,
-                        tx_type=TxType(tx_data.get("tx_type", "TRANSFER")),
-                        from_address=tx_data.get("from_address", ""),
-                        to_address=tx_data.get("to_address"),
-                        amount=Decimal(str(tx_data.get("amount", 0))),
-                        fee=Decimal(str(tx_data.get("fee", 0))),
-                        nonce=tx_data.get("nonce", 0),
-                        gas_price=tx_data.get("gas_price", 0),
-                        gas_limit=tx_data.get("gas_limit", 0),
-                        gas_used=tx_data.get("gas_limit", 0),
-                        signature=tx_data.get("signature", ""),
-                        pub_key=tx_data.get("pub_key", ""),
-                        payload=tx_data.get("payload", {}),
-                        tx_index=idx,
-                    )
-                    session.add(tx)
-
-                    # Collect addresses for later batch update
-                    if tx_data.get("from_address"):
-                        addresses_to_update.add(tx_data.get("from_address"))
-                    if tx_data.get("to_address"):
-                        addresses_to_update.add(tx_data.get("to_address"))
+            # A lost batch after a crash is simply re-indexed, so skip the WAL flush wait
+            await session.execute(_ASYNC_COMMIT)
+
+            # Append-only tables: one executemany INSERT each, blocks first for the FK
+            await session.execute(_BLOCK_INSERT_STMT, block_rows)
+            if tx_rows:
+                await session.execute(_TX_INSERT_STMT, tx_rows)
 
             # Update indexed height
             await self._set_indexed_height(session, max_height)
 
-            # Flush to get IDs
-            await session.flush()
-
             # Update accounts in batch (lightweight - just mark last seen)
+            new_accounts = 0
             if addresses_to_update:
-                await self._update_accounts_batch(session, addresses_to_update, max_height)
-
-    async def _update_accounts_batch(self, session, addresses: set[str], height: int):
-        """Batch update accounts - lightweight version without HTTP calls."""
-        now = datetime.utcnow()
-
-        for address in addresses:
-            # Just upsert minimal account info - balance will be fetched on-demand via API
-            stmt = insert(Account).values(
-                address=address,
-                balance=Decimal("0"),  # Will be updated when account is viewed
-                nonce=0,
-                tx_count=0,
-                tx_sent_count=0,
-                tx_received_count=0,
-                last_seen_height=height,
-                last_seen_at=now,
-                updated_at=now,
-            ).on_conflict_do_update(
+                new_accounts = await self._update_accounts_batch(session, addresses_to_update, max_height)
+
+            await self._increment_counters(session, {
+                BLOCKS_TOTAL: len(block_rows),
+                TRANSACTIONS_TOTAL: len(tx_rows),
+                ACCOUNTS_TOTAL: new_accounts,
+            })
+
+        self.indexed_height = max_height
+
+        stale_keys = [STATS_OVERVIEW_KEY]
+        if validators_changed:
+            stale_keys.append(VALIDATORS_KEY)
+        await invalidate(*stale_keys)
+
+    async def _update_accounts_batch(self, session, addresses: set[str], height: int) -> int:
+        """Batch update accounts - lightweight version without HTTP calls.
+
+        Returns the number of accounts created.
+        """
+        now = utcnow()
+        if len(addresses) >= ACCOUNT_COPY_THRESHOLD:
+            return await self._copy_accounts_batch(session, addresses, height, now)
+
+        rows = [
+            {
+                "address": address,
+                "balance": _ZERO,  # Will be updated when account is viewed
+                "nonce": 0,
+                "tx_count": 0,
+                "tx_sent_count": 0,
+                "tx_received_count": 0,
+                "last_seen_height": height,
+                "last_seen_at": now,
+                "updated_at": now,
+            }
+            for address in addresses
+        ]
+        created = 0
+
+        # Balance will be fetched on-demand via API; one upsert per chunk keeps
+        # the bind parameter count under PostgreSQL's 65535 limit
+        for i in range(0, len(rows), ACCOUNT_UPSERT_CHUNK_SIZE):
+            stmt = insert(Account).values(rows[i:i + ACCOUNT_UPSERT_CHUNK_SIZE])
+            stmt = stmt.on_conflict_do_update(
                 index_elements=["address"],
                 set_={
-                    "last_seen_height": height,
-                    "last_seen_at": now,
-                    "updated_at": now,
+                    "last_seen_height": stmt.excluded.last_seen_height,
+                    "last_seen_at": stmt.excluded.last_seen_at,
+                    "updated_at": stmt.excluded.updated_at,
                 }
-            )
-            await session.execute(stmt)
+            ).returning(literal_column("xmax = 0"))  # true when the row was inserted
+            result = await session.execute(stmt)
+            created += sum(result.scalars().all())
+
+        return created
+
+    async def _copy_accounts_batch(self, session, addresses: set[str], height: int, now: datetime) -> int:
+        """Upsert many accounts by COPYing them into a staging table first.
+
+        Returns the number of accounts created.
+        """
+        await session.execute(_CREATE_ACCOUNTS_STAGE)
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            "accounts_stage",
+            records=[(address, height, now) for address in addresses],
+            columns=["address", "last_seen_height", "last_seen_at"],
+        )
+
+        stage = _accounts_stage.c
+        stmt = insert(Account).from_select(
+            [
+                "address", "balance", "nonce", "tx_count", "tx_sent_count",
+                "tx_received_count", "last_seen_height", "last_seen_at", "updated_at",
+            ],
+            select(
+                stage.address, literal(0), literal(0), literal(0), literal(0),
+                literal(0), stage.last_seen_height, stage.last_seen_at, stage.last_seen_at,
+            ),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["address"],
+            set_={
+                "last_seen_height": stmt.excluded.last_seen_height,
+                "last_seen_at": stmt.excluded.last_seen_at,
+                "updated_at": stmt.excluded.updated_at,
+            }
+        ).returning(literal_column("xmax = 0"))  # true when the row was inserted
+        result = await session.execute(stmt)
+        return sum(result.scalars().all())
 
     async def _check_reorg(self):
         """Check for chain reorganization in recent blocks."""
@@ -243,48 +451,57 @@ class IndexerService:
             return
 
         check_from = max(1, indexed_height - settings.resync_depth)
-        reorg_height = None
 
         async with get_session_context() as session:
-            for height in range(indexed_height, check_from - 1, -1):
-                result = await session.execute(
-                    select(Block).where(Block.height == height)
-                )
-                indexed_block = result.scalar_one_or_none()
-                if not indexed_block:
-                    continue
-
-                chain_block = await self.client.get_block(height)
-                if not chain_block:
-                    continue
-
-                chain_hash = self.client.compute_block_hash(chain_block)
-
-                if indexed_block.hash != chain_hash:
-                    logger.warning(f"Reorg detected at height {height}!")
-                    reorg_height = height
-                    break
+            result = await session.execute(
+                select(Block.height, Block.hash)
+                .where(Block.height.between(check_from, indexed_height))
+            )
+            indexed_hashes = dict(result.all())
+
+        heights = range(check_from, indexed_height + 1)
+        chain_blocks = await asyncio.gather(*(self.client.get_block(h) for h in heights))
+
+        # Only heights present on both sides can be compared
+        chain_pairs = {
+            (height, self.client.compute_block_hash(chain_block))
+            for height, chain_block in zip(heights, chain_blocks)
+            if chain_block and height in indexed_hashes
+        }
+        fetched = {height for height, _ in chain_pairs}
+        indexed_pairs = {pair for pair in indexed_hashes.items() if pair[0] in fetched}
+        if indexed_pairs == chain_pairs:
+            return
 
-        if reorg_height:
-            await self._handle_reorg(reorg_height)
+        reorg_height = min(height for height, _ in indexed_pairs ^ chain_pairs)
+        logger.warning(f"Reorg detected at height {reorg_height}!")
+        await self._handle_reorg(reorg_height)
 
     async def _handle_reorg(self, from_height: int):
         """Handle chain reorganization by resyncing from given height."""
         logger.info(f"Handling reorg from height {from_height}")
 
         async with get_session_context() as session:
-            await session.execute(
-                delete(Transaction).where(Transaction.block_height >= from_height)
-            )
-            await session.execute(
-                delete(Block).where(Block.height >= from_height)
-            )
-            await self._set_indexed_height(session, from_height - 1)
+            await self._delete_from(session, from_height)
+        self.indexed_height = from_height - 1
 
         chain_height = await self.client.get_block_height()
         if chain_height >= from_height:
             await self._sync_blocks_batch(from_height, chain_height)
 
+    async def _delete_from(self, session, from_height: int):
+        """Delete indexed blocks from given height up and rewind (within existing session)."""
+        # Transactions go with their blocks through the FK's ON DELETE CASCADE
+        result = await session.execute(
+            delete(Block).where(Block.height >= from_height).returning(Block.tx_count)
+        )
+        tx_counts = result.scalars().all()
+        await self._set_indexed_height(session, from_height - 1)
+        await self._increment_counters(session, {
+            BLOCKS_TOTAL: -len(tx_counts),
+            TRANSACTIONS_TOTAL: -sum(tx_counts),
+        })
+
 
 async def run_indexer():
     """Run the indexer service."""
@@ -2,5 +2,9 @@
 from .block import Block
 from .transaction import Transaction, TxType
 from .account import Account, SyncStatus
+from .counter import Counter, BLOCKS_TOTAL, TRANSACTIONS_TOTAL, ACCOUNTS_TOTAL
 
-__all__ = ["Block", "Transaction", "TxType", "Account", "SyncStatus"]
+__all__ = [
+    "Block", "Transaction", "TxType", "Account", "SyncStatus",
+    "Counter", "BLOCKS_TOTAL", "TRANSACTIONS_TOTAL", "ACCOUNTS_TOTAL",
+]
@@ -1,11 +1,12 @@
 """Account model."""
 from datetime import datetime
 from decimal import Decimal
-from sqlalchemy import BigInteger, String, DateTime, Numeric, Boolean, Index
+from sqlalchemy import BigInteger, String, DateTime, Numeric, Boolean, Index, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from core.database import Base
+from core.utils import utcnow
 
 
 class Account(Base):
@@ -36,13 +37,14 @@ class Account(Base):
     validator_info: Mapped[dict] = mapped_column(JSONB, nullable=True)
 
     # Metadata
-    indexed_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    indexed_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow, onupdate=utcnow)
 
     __table_args__ = (
         Index("ix_accounts_balance", "balance"),
         Index("ix_accounts_tx_count", "tx_count"),
         Index("ix_accounts_is_validator", "is_validator"),
+        Index("ix_accounts_validator_balance", "balance", postgresql_where=text("is_validator")),
     )
 
     def __repr__(self):
@@ -57,7 +59,7 @@ class SyncStatus(Base):
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     key: Mapped[str] = mapped_column(String(64), unique=True, nullable=False)
     value: Mapped[str] = mapped_column(String(256), nullable=True)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow, onupdate=utcnow)
 
     def __repr__(self):
         return f"<SyncStatus {self.key}={self.value}>"
@@ -5,6 +5,7 @@ from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from core.database import Base
+from core.utils import utcnow
 
 
 class Block(Base):
@@ -41,7 +42,7 @@ class Block(Base):
     pq_sig_scheme_id: Mapped[int] = mapped_column(Integer, nullable=True)
 
     # Metadata
-    indexed_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    indexed_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
 
     # Relationships
     transactions: Mapped[list["Transaction"]] = relationship(
@@ -51,6 +52,7 @@ class Block(Base):
     __table_args__ = (
         Index("ix_blocks_timestamp", "timestamp"),
         Index("ix_blocks_proposer_height", "proposer_address", "height"),
+        Index("ix_blocks_indexed_at_height", "indexed_at", "height"),
     )
 
     def __repr__(self):
@@ -0,0 +1,22 @@
+"""Counter model."""
+from sqlalchemy import BigInteger, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.database import Base
+
+# Counter keys maintained by the indexer
+BLOCKS_TOTAL = "blocks_total"
+TRANSACTIONS_TOTAL = "transactions_total"
+ACCOUNTS_TOTAL = "accounts_total"
+
+
+class Counter(Base):
+    """Row count maintained by the indexer, so APIs avoid COUNT(*) on large tables."""
+
+    __tablename__ = "counters"
+
+    key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    value: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<Counter {self.key}={self.value}>"
@@ -7,6 +7,7 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 import enum
 
 from core.database import Base
+from core.utils import utcnow
 
 
 class TxType(str, enum.Enum):
@@ -59,7 +60,7 @@ class Transaction(Base):
     tx_index: Mapped[int] = mapped_column(Integer, default=0)
 
     # Metadata
-    indexed_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    indexed_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
 
     # Relationships
     block: Mapped["Block"] = relationship("Block", back_populates="transactions")
@@ -68,6 +69,9 @@ class Transaction(Base):
         Index("ix_transactions_from_nonce", "from_address", "nonce"),
         Index("ix_transactions_block_index", "block_height", "tx_index"),
         Index("ix_transactions_type_height", "tx_type", "block_height"),
+        # Per-address history ordered by (block_height, tx_index)
+        Index("ix_transactions_from_height", "from_address", "block_height", "tx_index"),
+        Index("ix_transactions_to_height", "to_address", "block_height", "tx_index"),
     )
 
     def __repr__(self):